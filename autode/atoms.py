@@ -1,5 +1,6 @@
 import numpy as np
 from copy import deepcopy
+from functools import lru_cache
 from typing import Union, Optional, List, Sequence, Any
 from autode.log import logger
 from autode.geom import get_rot_mat_euler
@@ -288,7 +289,7 @@ class Atom:
         """
 
         try:
-            return Mass(atomic_weights[self.label])
+            return _atomic_weight(self.label)
 
         except KeyError:
             logger.warning(
@@ -1532,6 +1533,14 @@ atomic_weights = {
     "Og": 294.0,
 }
 
+
+@lru_cache(maxsize=None)
+def _atomic_weight(atomic_symbol: str) -> Mass:
+    """Atomic weight of an element. Cached, as there are few unique elements
+    and the same labels are looked up many times e.g. for mass weighting"""
+    return Mass(atomic_weights[atomic_symbol])
+
+
 # van der Walls radii from https://books.google.no/books?id=bNDMBQAAQBAJ
 vdw_radii = {
     "H": 1.1,
@@ -1,5 +1,6 @@
 import itertools
 import os
+import numpy as np
 from autode.geom import get_neighbour_list
 from autode.log import logger
 from autode.config import Config
@@ -849,6 +850,36 @@ class BondRearrangement:
         """Unique atom indexes in forming or breaking bonds"""
         return list(sorted(set(a for b in self.all for a in b)))
 
+    @property
+    def fbonds_arr(self):
+        """Forming bond atom index pairs as an (n, 2) integer array"""
+        return self._idx_array(self.fbonds)
+
+    @property
+    def bbonds_arr(self):
+        """Breaking bond atom index pairs as an (n, 2) integer array"""
+        return self._idx_array(self.bbonds)
+
+    @property
+    def all_arr(self):
+        """Forming and breaking bond pairs as an (n, 2) integer array"""
+        return self._idx_array(self.all)
+
+    def _idx_array(self, bonds):
+        """
+        Atom index pairs as a NumPy array suitable for indexing coordinates.
+        Cached on the bond list contents, as a rearrangement is constructed
+        once per reaction then reused across many TS candidates
+        """
+        key = tuple(tuple(bond) for bond in bonds)
+
+        if key not in self._idx_arrays:
+            self._idx_arrays[key] = np.array(key, dtype=np.intp).reshape(
+                -1, 2
+            )
+
+        return self._idx_arrays[key]
+
     @property
     def n_fbonds(self):
         return len(self.fbonds)
@@ -874,3 +905,4 @@ class BondRearrangement:
         self.bbonds = breaking_bonds if breaking_bonds is not None else []
 
         self.all = self.fbonds + self.bbonds
+        self._idx_arrays: dict = {}
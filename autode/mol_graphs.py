@@ -196,6 +196,16 @@ def make_graph(
     coords = species.coordinates
     dist_mat = distance_matrix(coords, coords)
 
+    # Equilibrium distances depend only on the pair of atomic symbols, so
+    # cache them rather than rebuilding from the radii for every (i, j) pair
+    eqm_dists: dict = {}
+
+    def eqm_bond_distance(i, j):
+        key = (species.atoms[i].atomic_symbol, species.atoms[j].atomic_symbol)
+        if key not in eqm_dists:
+            eqm_dists[key] = species.atoms.eqm_bond_distance(i, j)
+        return eqm_dists[key]
+
     # Enumerate atoms low->high atomic weight for consistent graph generation
     for i, _ in enumerate(
         sorted(species.atoms, key=lambda _atom: _atom.weight)
@@ -206,7 +216,7 @@ def make_graph(
                 continue
 
             # Get r_avg for this X-Y bond e.g. C-C -> 1.5 Å
-            avg_bond_length = species.atoms.eqm_bond_distance(i, j)
+            avg_bond_length = eqm_bond_distance(i, j)
 
             # If the distance between atoms i and j are less or equal to
             # 1.25x average length add a 'bond'
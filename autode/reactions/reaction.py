@@ -188,7 +188,7 @@ class Reaction:
         """
 
         def total(molecules, attr):
-            return sum([getattr(m, attr) for m in molecules])
+            return sum(getattr(m, attr) for m in molecules)
 
         if total(self.reacs, "n_atoms") != total(self.prods, "n_atoms"):
             raise UnbalancedReaction("Number of atoms doesn't balance")
@@ -56,7 +56,7 @@ class Parser:
         electrons will default to a singlet"""
 
         n_electrons = (
-            sum([at.atomic_number for at in self.atoms]) - self.charge
+            sum(at.atomic_number for at in self.atoms) - self.charge
         )
 
         # Atoms have implicit hydrogens, so add them
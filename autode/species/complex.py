@@ -183,10 +183,8 @@ class Complex(Species):
                 f". Not present in this complex"
             )
 
-        first_index = sum([mol.n_atoms for mol in self._molecules[:mol_index]])
-        last_index = sum(
-            [mol.n_atoms for mol in self._molecules[: mol_index + 1]]
-        )
+        first_index = sum(mol.n_atoms for mol in self._molecules[:mol_index])
+        last_index = first_index + self._molecules[mol_index].n_atoms
 
         return list(range(first_index, last_index))
 
@@ -2,9 +2,11 @@ from abc import ABC
 import numpy as np
 import autode.exceptions as ex
 
-from typing import Optional, TYPE_CHECKING
+from copy import copy
+from functools import cached_property
+from typing import Optional, Tuple, TYPE_CHECKING
 
-from autode.atoms import metals
+from autode.atoms import Atoms, metals
 from autode.config import Config
 from autode.geom import calc_rmsd
 from autode.constraints import DistanceConstraints
@@ -12,13 +14,15 @@ from autode.log import logger
 from autode.methods import get_hmethod, get_lmethod
 from autode.mol_graphs import make_graph, species_are_isomorphic
 from autode.species.species import Species
+from autode.utils import ProcessPool
 from autode.exceptions import AutodeException
 
 
 if TYPE_CHECKING:
     from autode.species import Species
     from autode.bond_rearrangement import BondRearrangement
-    from autode.atoms import Atoms
+    from autode.mol_graphs import MolecularGraph
+    from autode.wrappers.methods import Method
 
 
 class TSbase(Species, ABC):
@@ -77,7 +81,6 @@ class TSbase(Species, ABC):
         self.product = product
         self.bond_rearrangement = bond_rearr
 
-        self._init_graph()
         self._init_solvent()
 
     def __eq__(self, other):
@@ -88,6 +91,23 @@ class TSbase(Species, ABC):
             super().__eq__(other),
         )
 
+    @property
+    def graph(self) -> Optional["MolecularGraph"]:
+        """
+        Molecular graph of this TS, initialised lazily from the reactant
+        graph. Copying the graph is not free, so TS guesses that are
+        discarded without ever using it never pay for the copy
+        """
+        if self._graph is None and self.reactant is not None:
+            self._init_graph()
+
+        return super().graph
+
+    @graph.setter
+    def graph(self, value: Optional["MolecularGraph"]):
+        """Setter for the molecular graph"""
+        self._graph = value
+
     def _init_graph(self) -> None:
         """Set the molecular graph for this TS object from the reactant"""
 
@@ -131,6 +151,17 @@ class TSbase(Species, ABC):
 
         return None
 
+    @cached_property
+    def _hmethod(self) -> "Method":
+        """
+        High-level electronic structure method, resolved once per TS.
+        get_hmethod() re-instantiates every wrapper and may check binary
+        availability, so should not be called repeatedly on the hot
+        mode-checking path. Cached per instance rather than globally so that
+        changes to Config between TS objects are still respected
+        """
+        return get_hmethod()
+
     @property
     def has_imaginary_frequencies(self) -> bool:
         """Does this possible transition state have any imaginary modes?"""
@@ -162,7 +193,7 @@ class TSbase(Species, ABC):
 
         if self.hessian is None:
             logger.info("Calculating the hessian..")
-            self._run_hess_calculation(method=get_hmethod())
+            self._run_hess_calculation(method=self._hmethod)
 
         imag_freqs = self.imaginary_frequencies
 
@@ -250,14 +281,10 @@ class TSbase(Species, ABC):
             " bonds"
         )
 
-        f_species = displaced_species_along_mode(
+        f_species, b_species = forward_backward_displaced_species(
             self, mode_number=6, max_atom_disp=0.5, disp_factor=disp_mag
         )
 
-        b_species = displaced_species_along_mode(
-            self, mode_number=6, max_atom_disp=0.5, disp_factor=-disp_mag
-        )
-
         # Be conservative with metal complexes - what even is a bond..
         if imag_mode_generates_other_bonds(
             self, f_species, b_species, allow_mx=True
@@ -267,48 +294,40 @@ class TSbase(Species, ABC):
             )
             return False
 
+        fbonds = self.bond_rearrangement.fbonds_arr
+        bbonds = self.bond_rearrangement.bbonds_arr
+
+        # TS distances are identical for both products, so batch-compute them
+        # once by indexing the bond endpoints into the coordinate array
+        ts_coords = self.coordinates
+        ts_f_dists = _bond_distances(ts_coords, fbonds)
+        ts_b_dists = _bond_distances(ts_coords, bbonds)
+
         # Product could be either the forward displaced molecule or the
         # backwards equivalent
         for product in (f_species, b_species):
-            fbond_bbond_correct_disps = []
-
-            for fbond in self.bond_rearrangement.fbonds:
-                ts_dist = self.distance(*fbond)
-                p_dist = product.distance(*fbond)
-
-                # Displaced distance towards products should be shorter than
-                # the distance at the TS if the bond is forming
-                if ts_dist - p_dist > delta_threshold:
-                    fbond_bbond_correct_disps.append(True)
-
-                else:
-                    fbond_bbond_correct_disps.append(False)
-
-            for bbond in self.bond_rearrangement.bbonds:
-                ts_dist = self.distance(*bbond)
-                p_dist = product.distance(*bbond)
-
-                # Displaced distance towards products should be longer than the
-                # distance at the TS if the bond is breaking
-                if p_dist - ts_dist > delta_threshold:
-                    fbond_bbond_correct_disps.append(True)
-
-                else:
-                    fbond_bbond_correct_disps.append(False)
-
-            logger.info(
-                f"List of forming and breaking bonds that have the "
-                f"correct properties {fbond_bbond_correct_disps}"
+            p_coords = product.coordinates
+
+            # Displacement towards products should shorten forming bonds and
+            # lengthen breaking ones. One vectorised comparison over all the
+            # bonds replaces a Python loop per bond
+            correct_disps = np.concatenate(
+                (
+                    ts_f_dists - _bond_distances(p_coords, fbonds)
+                    > delta_threshold,
+                    _bond_distances(p_coords, bbonds) - ts_b_dists
+                    > delta_threshold,
+                )
             )
 
-            if all(fbond_bbond_correct_disps) and req_all:
+            if req_all and np.all(correct_disps):
                 logger.info(
                     f"{product.name} afforded the correct bond "
                     f"forming/breaking reactants -> products"
                 )
                 return True
 
-            if not req_all and any(fbond_bbond_correct_disps):
+            if not req_all and np.any(correct_disps):
                 logger.info("At least one bond had the correct displacement")
                 return True
 
@@ -340,52 +359,57 @@ class TSbase(Species, ABC):
                 " and/or products not set "
             )
 
-        # Generate and optimise conformers with the low level of theory
-        try:
-            self.reactant.populate_conformers()
-            self.product.populate_conformers()
-        except NotImplementedError:
-            logger.error(
-                "Could not generate conformers of reactant/product(s)"
-                " QRC will run without conformers"
-            )
-
-        # Get the species by displacing forwards along the mode
-        f_mol = displaced_species_along_mode(
+        # Get the species by displacing forwards and backwards along the mode
+        f_mol, b_mol = forward_backward_displaced_species(
             self, mode_number=6, disp_factor=disp_mag, max_atom_disp=0.2
         )
         f_mol.name = f"{self.name}_forwards"
-
-        # and the same backwards
-        b_mol = displaced_species_along_mode(
-            self, mode_number=6, disp_factor=-disp_mag, max_atom_disp=0.2
-        )
         b_mol.name = f"{self.name}_backwards"
         assert f_mol.graph and b_mol.graph, "Must have graphs"
 
         # The high and low level methods may not have the same minima, so
         # optimise and recheck isomorphisms
-        for method in (get_hmethod(), get_lmethod()):
-            for mol in (f_mol, b_mol):
-                try:
-                    mol.optimise(
-                        method=method,
-                        keywords=method.keywords.low_opt,
-                        reset_graph=True,
-                    )
+        conformers_populated = False
 
-                except ex.CalculationException:
-                    logger.error(
-                        f"Failed to optimise {mol.name} with "
-                        f"{method}. Assuming no link"
-                    )
-                    return False
+        for method in (self._hmethod, get_lmethod()):
+            try:
+                f_mol, b_mol = _optimise_mols_in_parallel(
+                    f_mol, b_mol, method=method
+                )
+
+            except ex.CalculationException:
+                logger.error(
+                    f"Failed to optimise {f_mol.name} and/or "
+                    f"{b_mol.name} with {method}. Assuming no link"
+                )
+                return False
 
             if forward_backward_isomorphic_to_reactant_product(
                 f_mol, b_mol, self.reactant, self.product
             ):
                 return True
 
+            if not conformers_populated:
+                # Conformers of the end states allow for isomorphism checks
+                # against alternate minima, but generating and optimising
+                # them is expensive, so only do so once the direct check
+                # above has failed
+                conformers_populated = True
+                try:
+                    self.reactant.populate_conformers()
+                    self.product.populate_conformers()
+                except NotImplementedError:
+                    logger.error(
+                        "Could not generate conformers of reactant/product(s)"
+                        " QRC will run without conformers"
+                    )
+                    continue
+
+                if forward_backward_isomorphic_to_reactant_product(
+                    f_mol, b_mol, self.reactant, self.product
+                ):
+                    return True
+
         logger.info(f"Forwards displaced edges {f_mol.graph.edges}")
         logger.info(f"Backwards displaced edges {b_mol.graph.edges}")
         return False
@@ -448,25 +472,91 @@ def displaced_species_along_mode(
             "could be found"
         )
 
+    disp = _mode_displacement(mode_disp_coords, disp_factor, max_atom_disp)
+
+    return _displaced_species(species, species.coordinates + disp)
+
+
+def forward_backward_displaced_species(
+    species: Species,
+    mode_number: int,
+    disp_factor: float = 1.0,
+    max_atom_disp: float = 99.9,
+) -> Tuple[Species, Species]:
+    """
+    Displace the geometry forwards (+disp_factor) and backwards
+    (-disp_factor) along a normal mode. Equivalent to two calls of
+    displaced_species_along_mode, but the mode and base coordinates are only
+    extracted once
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        species (autode.species.Species):
+
+        mode_number (int): Mode number to displace along
+
+        disp_factor (float): Distance to displace (default: {1.0})
+
+        max_atom_disp (float): Maximum displacement of any atom (Å)
+
+    Returns:
+        (tuple(autode.species.Species)): Forward and backward displaced
+                                         species
+
+    Raises:
+        (autode.exceptions.AutodeException):
+    """
+    logger.info(
+        f"Displacing forwards and backwards along mode {mode_number} "
+        f"in {species.name}"
+    )
+
+    mode_disp_coords = species.normal_mode(mode_number)
+    if mode_disp_coords is None:
+        raise AutodeException(
+            "Could not get displaced species. No normal mode could be found"
+        )
+
+    disp = _mode_displacement(mode_disp_coords, disp_factor, max_atom_disp)
     coords = species.coordinates
-    disp_coords = coords.copy() + disp_factor * mode_disp_coords
 
-    # Ensure the maximum displacement distance any single atom is below the
-    # threshold (max_atom_disp), by incrementing backwards in steps of 0.05 Å,
-    # for disp_factor = 1.0 Å
-    for _ in range(20):
-        if (
-            np.max(np.linalg.norm(coords - disp_coords, axis=1))
-            < max_atom_disp
-        ):
-            break
+    return (
+        _displaced_species(species, coords + disp),
+        _displaced_species(species, coords - disp),
+    )
+
+
+def _mode_displacement(
+    mode_disp_coords: np.ndarray, disp_factor: float, max_atom_disp: float
+) -> np.ndarray:
+    """
+    Displacement vector along a normal mode, where the maximum displacement
+    distance of any single atom is kept below the threshold (max_atom_disp)
+    by scaling back in steps of 1/20th of the full displacement, i.e. 0.05 Å
+    for disp_factor = 1.0 Å
+    """
+    max_disp = abs(disp_factor) * np.max(
+        np.linalg.norm(mode_disp_coords, axis=1)
+    )
+
+    if max_disp < max_atom_disp:
+        n_back_steps = 0
+    else:
+        n_back_steps = min(20, int(20 * (1 - max_atom_disp / max_disp)) + 1)
 
-        disp_coords -= (disp_factor / 20) * mode_disp_coords
+    return (1 - n_back_steps / 20) * disp_factor * mode_disp_coords
 
-    # Create a new species from the initial
+
+def _displaced_species(species: Species, disp_coords: np.ndarray) -> Species:
+    """
+    Create a new species from an initial one with a set of displaced
+    coordinates. Only a shallow copy of each atom is needed (Atoms.copy() is
+    a full deepcopy), as every coordinate is replaced with a fresh array when
+    the displaced coordinates are set
+    """
     disp_species = Species(
         name=f"{species.name}_disp",
-        atoms=species.atoms.copy(),
+        atoms=Atoms(copy(atom) for atom in species.atoms),
         charge=species.charge,
         mult=species.mult,
     )
@@ -475,6 +565,63 @@ def displaced_species_along_mode(
     return disp_species
 
 
+def _bond_distances(coords: np.ndarray, idxs: np.ndarray) -> np.ndarray:
+    """Distances for an (n, 2) array of atom index pairs, as a flat array"""
+    return np.linalg.norm(coords[idxs[:, 0]] - coords[idxs[:, 1]], axis=1)
+
+
+def _optimise_mol(mol: Species, method: "Method", n_cores: int) -> Species:
+    """Top-level hashable function to call in parallel"""
+    mol.optimise(
+        method=method,
+        keywords=method.keywords.low_opt,
+        reset_graph=True,
+        n_cores=n_cores,
+    )
+    return mol
+
+
+def _optimise_mols_in_parallel(
+    f_mol: Species, b_mol: Species, method: "Method"
+) -> Tuple[Species, Species]:
+    """
+    Optimise the forward and backward displaced molecules concurrently. The
+    two optimisations are independent so can share the available cores
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        f_mol (autode.species.Species): Forward displaced species
+
+        b_mol (autode.species.Species): Backward displaced species
+
+        method (autode.wrappers.methods.Method):
+
+    Returns:
+        (tuple(autode.species.Species)): Optimised forward and backward
+                                         displaced species
+
+    Raises:
+        (autode.exceptions.CalculationException):
+    """
+    if f_mol.name == b_mol.name:
+        # Calculation filenames derive from the molecule names, so the two
+        # concurrent optimisations must not share one
+        f_mol.name += "_forwards"
+        b_mol.name += "_backwards"
+
+    n_cores_pp = max(Config.n_cores // 2, 1)
+
+    with ProcessPool(max_workers=2) as pool:
+        jobs = [
+            pool.submit(_optimise_mol, mol, method, n_cores=n_cores_pp)
+            for mol in (f_mol, b_mol)
+        ]
+
+        f_mol, b_mol = (job.result() for job in jobs)
+
+    return f_mol, b_mol
+
+
 def imag_mode_generates_other_bonds(
     ts: TSbase, f_species: Species, b_species: Species, allow_mx: bool = False
 ) -> bool:
@@ -497,39 +644,50 @@ def imag_mode_generates_other_bonds(
         (bool):
     """
 
-    _ts: TSbase = ts.copy()
-    assert _ts.graph is not None, "TS must have a molecular graph"
+    # Only the atoms and graph of the TS are used here, so clone those rather
+    # than deepcopying the whole TS, along with its reactant, product and
+    # any conformers
+    _ts = ts.new_species(name=ts.name)
 
     for species in (_ts, f_species, b_species):
         make_graph(species, rel_tolerance=0.3)
 
-    for product in (f_species, b_species):
-        assert product.graph is not None, "Must have a graph for product"
+    assert _ts.graph is not None, "TS must have a molecular graph"
 
-        new_bonds_in_product = set(
-            [
-                bond
-                for bond in product.graph.edges
-                if bond not in _ts.graph.edges
-            ]
-        )
+    br = ts.bond_rearrangement
+    assert br is not None, "Must have a bond rearrangement"
 
-        if allow_mx:
-            new_bonds_in_product = set(
-                [
-                    (i, j)
-                    for i, j in new_bonds_in_product
-                    if _ts.atoms[i].label not in metals
-                    and _ts.atoms[j].label not in metals
-                ]
-            )
+    # Hoist the membership tests out of the loops: frozensets make the edge
+    # lookup invariant to the (i, j) ordering, and avoid rebuilding the
+    # active atom set, which is sorted on every access, per product
+    ts_edges = frozenset(frozenset(bond) for bond in _ts.graph.edges)
+    active_atoms = frozenset(br.active_atoms)
+
+    def is_new_bond(bond) -> bool:
+        """Is this bond present in a product but absent in the TS, and not an
+        allowed metal-X bond?"""
+        if frozenset(bond) in ts_edges:
+            return False
+
+        if allow_mx and any(_ts.atoms[i].label in metals for i in bond):
+            return False
 
-        br = _ts.bond_rearrangement
-        assert br is not None, "Must have a bond rearrangement"
+        return True
 
-        if not set(a for b in new_bonds_in_product for a in b).issubset(
-            set(br.active_atoms)
+    for product in (f_species, b_species):
+        assert product.graph is not None, "Must have a graph for product"
+
+        # Stream over the product edges, exiting on the first new bond that
+        # involves a non-active atom rather than materialising the full set
+        if any(
+            a not in active_atoms
+            for bond in product.graph.edges
+            if is_new_bond(bond)
+            for a in bond
         ):
+            new_bonds_in_product = set(
+                bond for bond in product.graph.edges if is_new_bond(bond)
+            )
             logger.warning(f"New bonds in product: {new_bonds_in_product}")
             logger.warning(
                 f"Active bonds: {br.all}. Active atoms {br.active_atoms}"
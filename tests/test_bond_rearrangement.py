@@ -200,6 +200,27 @@ def test_bondrearr_class():
         _ = rearrang.get_active_atom_neighbour_lists(mol_c, depth=1)
 
 
+def test_bondrearr_index_arrays():
+    rearrang = br.BondRearrangement(
+        forming_bonds=[(0, 1)], breaking_bonds=[(1, 2)]
+    )
+
+    assert rearrang.fbonds_arr.shape == (1, 2)
+    assert rearrang.all_arr.shape == (2, 2)
+    assert list(rearrang.bbonds_arr[0]) == [1, 2]
+
+    # Arrays are cached, but invalidated if the bonds change
+    assert rearrang.fbonds_arr is rearrang.fbonds_arr
+    rearrang.bbonds.append((0, 2))
+    assert rearrang.bbonds_arr.shape == (2, 2)
+
+    # and have a usable 2D shape even with no bonds of that type
+    assert br.BondRearrangement(forming_bonds=[(0, 1)]).bbonds_arr.shape == (
+        0,
+        2,
+    )
+
+
 def test_get_bond_rearrangs():
     # ethane --> Ch3 + Ch3
     reac = Molecule(smiles="CC")
@@ -298,6 +298,28 @@ def test_exec_not_avail_method():
         calc.run()
 
 
+@work_in_tmp_dir()
+def test_exec_skipped_with_existing_normal_output():
+    xtb = XTB()
+    xtb.path = "/a/non/existent/path"
+    assert not xtb.is_available
+
+    calc = Calculation(
+        name="tmp", molecule=h2o(), method=xtb, keywords=xtb.keywords.sp
+    )
+    calc._executor.generate_input()
+    calc._executor.output.filename = xtb.output_filename_for(calc._executor)
+
+    # Generate an output that looks like a normally terminated calculation
+    with open(calc.output.filename, "w") as output_file:
+        print("\n".join(25 * ["a normal line"]), file=output_file)
+
+    assert calc.terminated_normally
+
+    # so executing again skips the run, and the unavailable method is not hit
+    calc._executor._execute_external()
+
+
 @work_in_tmp_dir()
 def test_exec_too_much_memory_requested_above_py39():
     if sys.version_info.minor < 9:
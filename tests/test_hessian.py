@@ -441,6 +441,20 @@ def test_hessian_modes():
     assert h2o.hessian.units == ha_per_ang_sq
 
 
+def test_hessian_modes_are_cached():
+    """Normal modes are diagonalised once then reused, so repeated mode
+    queries e.g. during TS mode checking do not rediagonalise the Hessian"""
+
+    h2o = Molecule(smiles="O")
+    h2o.hessian = h2o_hessian_arr
+
+    assert h2o.hessian.normal_modes_proj is h2o.hessian.normal_modes_proj
+    assert h2o.hessian.frequencies_proj is h2o.hessian.frequencies_proj
+
+    # and the same modes are indexed by Species.normal_mode
+    assert h2o.normal_mode(6) is h2o.normal_mode(6)
+
+
 @testutils.work_in_zipped_dir(os.path.join(here, "data", "hessians.zip"))
 def test_proj_modes():
     """